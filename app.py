@@ -2,7 +2,7 @@ import os
 import tempfile
 import shutil
 import streamlit as st
-from enhancer import PDFOCREnhancer
+from enhancer import PDFOCREnhancer, default_candidate_languages
 from ui_utils import display_pdf, preview_pdf_page, get_memory_usage
 import fitz  # PyMuPDF
 import time
@@ -72,12 +72,43 @@ def main():
     # Sidebar for settings
     st.sidebar.header("Settings")
     
+    available_languages = ["eng", "fra", "deu", "tur", "rus"]  # Lowercase for tesseract compatibility
     language = st.sidebar.selectbox(
         "OCR Language", 
-        ["eng", "fra", "deu", "tur", "rus"],  # Changed to lowercase for tesseract compatibility
+        available_languages,
         index=0
     )
     
+    custom_language = st.sidebar.text_input(
+        "Custom Language (optional)",
+        "",
+        help="Tesseract language string, e.g. eng+rus for a combined model. Overrides OCR Language."
+    )
+    if custom_language.strip():
+        language = custom_language.strip().lower()
+    
+    auto_detect = st.sidebar.checkbox(
+        "Auto-detect orientation & language",
+        value=False,
+        help="Run Tesseract OSD on a low-DPI thumbnail of each page to fix rotation and pick "
+             "the best single language model per page (faster than combined models like eng+rus)"
+    )
+    candidate_languages = [language]
+    if auto_detect:
+        candidate_languages = st.sidebar.multiselect(
+            "Candidate Languages",
+            available_languages,
+            default=default_candidate_languages(language, available_languages),
+            help="Models a page may be routed to. OCR Language is used when detection is not confident "
+                 "and is preferred whenever it matches the detected script."
+        ) or [language]
+    score_languages = auto_detect and st.sidebar.checkbox(
+        "Score same-script candidates",
+        value=False,
+        help="When several candidates share the detected script and none is the OCR Language, "
+             "run a quick OCR pass per candidate (at most 2) to pick one. Slower; off uses the first candidate."
+    )
+    
     dpi = st.sidebar.slider("Image DPI", min_value=100, max_value=600, value=300, step=50,
                           help="Higher DPI gives better quality but slower processing")
     
@@ -214,7 +245,10 @@ def main():
                     tesseract_path=tesseract_path if tesseract_path else None,
                     language=language,
                     dpi=dpi,
-                    preprocessing_level=preprocessing
+                    preprocessing_level=preprocessing,
+                    auto_detect=auto_detect,
+                    candidate_languages=candidate_languages,
+                    score_languages=score_languages
                 )
                 enhancer.verify_tesseract()
                 
@@ -244,6 +278,30 @@ def main():
                     
                     st.success(f"✅ Processing completed in {processing_time:.2f} seconds!")
                     
+                    # Worker-side timings exclude PDF conversion, merging and parallelism
+                    detections = enhancer.page_detections
+                    num_pages = max(1, len(detections))
+                    ocr_seconds = sum(d['ocr_seconds'] for d in detections)
+                    detect_seconds = sum(d['detect_seconds'] for d in detections)
+                    st.info(f"Per-page cost ({language}): {ocr_seconds / num_pages:.2f} s OCR"
+                            + (f" + {detect_seconds / num_pages:.2f} s detection" if auto_detect else ""))
+                    
+                    if auto_detect:
+                        rotated = sum(1 for d in detections if d['rotate'])
+                        st.info(f"Auto-detection: {rotated} rotated page(s) corrected")
+                        with st.expander("Per-page detection"):
+                            st.table([
+                                {
+                                    "Page": d['page'],
+                                    "Rotation": f"{d['rotate']}°",
+                                    "Script": d['script'] or "-",
+                                    "Language": d['language'],
+                                    "Detection (s)": f"{d['detect_seconds']:.2f}",
+                                    "OCR (s)": f"{d['ocr_seconds']:.2f}",
+                                }
+                                for d in detections
+                            ])
+                    
                     # Create tabs for results
                     tab1, tab2, tab3 = st.tabs(["Text", "Before/After Images", "Download Results"])
                     
@@ -327,6 +385,7 @@ def main():
         ### Performance Tips:
         - For faster processing: Lower DPI, "light" preprocessing, fewer pages
         - For better quality: Higher DPI, "heavy" preprocessing
+        - Mixed-language or rotated scans: enable "Auto-detect orientation & language" instead of a combined model
         
         ### Supported Languages:
         - eng: English
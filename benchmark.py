@@ -0,0 +1,94 @@
+import os
+import argparse
+import tempfile
+import shutil
+import time
+import difflib
+import fitz  # PyMuPDF
+from enhancer import PDFOCREnhancer, default_candidate_languages
+
+# Rotations applied to the benchmark pages in turn (PDF /Rotate, clockwise)
+ROTATIONS = [0, 90, 180, 270]
+
+LANGUAGES = ["eng", "fra", "deu", "tur", "rus"]
+
+def build_rotated_pdf(input_pdf, output_pdf, max_pages=None):
+    """Copy a text PDF, rotating its pages in turn, and return the embedded text of each page"""
+    reference = []
+    rotations = []
+    with fitz.open(input_pdf) as src:
+        out = fitz.open()
+        for index, page in enumerate(src):
+            if max_pages and index >= max_pages:
+                break
+            reference.append(page.get_text())
+            out.insert_pdf(src, from_page=index, to_page=index)
+            rotation = ROTATIONS[index % len(ROTATIONS)]
+            out[-1].set_rotation((page.rotation + rotation) % 360)
+            rotations.append(rotation)
+        out.save(output_pdf)
+        out.close()
+    return reference, rotations
+
+def similarity(expected, actual):
+    """Character-level similarity (0-1) between two texts, ignoring whitespace layout"""
+    return difflib.SequenceMatcher(None, " ".join(expected.split()), " ".join(actual.split())).ratio()
+
+def run(label, enhancer, pdf_path, reference, rotations, max_workers):
+    """Process the benchmark PDF once and print speed and accuracy figures"""
+    work_dir = tempfile.mkdtemp()
+    try:
+        start = time.time()
+        _, _, all_text, _, _ = enhancer.process_pdf(pdf_path, work_dir, max_workers=max_workers)
+        wall_seconds = time.time() - start
+    finally:
+        shutil.rmtree(work_dir, ignore_errors=True)
+
+    # Drop the "--- Page N ---" header added by process_pdf
+    texts = [entry.split("\n", 1)[1] for entry in all_text]
+    scores = [similarity(ref, text) for ref, text in zip(reference, texts)]
+    upright = [score for score, rotation in zip(scores, rotations) if rotation == 0]
+    rotated = [score for score, rotation in zip(scores, rotations) if rotation != 0]
+    detections = enhancer.page_detections
+    worker_seconds = sum(d['ocr_seconds'] + d['detect_seconds'] for d in detections)
+
+    def mean(values):
+        return sum(values) / len(values) if values else float('nan')
+
+    print(f"{label:<24} {worker_seconds / max(1, len(detections)):>10.2f} {wall_seconds:>9.2f} "
+          f"{mean(upright):>9.3f} {mean(rotated):>9.3f}")
+
+def main():
+    parser = argparse.ArgumentParser(
+        description="Compare per-page auto-detect against a combined language model on rotated pages"
+    )
+    parser.add_argument("pdf", help="PDF with an embedded text layer, used as the accuracy reference")
+    parser.add_argument("--combined", default="eng+rus", help="Combined model to compare against")
+    parser.add_argument("--language", default="eng", help="Fallback language for auto-detect")
+    parser.add_argument("--dpi", type=int, default=300)
+    parser.add_argument("--pages", type=int, default=8, help="Number of pages to use")
+    parser.add_argument("--workers", type=int, default=max(1, (os.cpu_count() or 1) - 1))
+    parser.add_argument("--tesseract-path", default=None)
+    args = parser.parse_args()
+
+    bench_dir = tempfile.mkdtemp()
+    try:
+        bench_pdf = os.path.join(bench_dir, "rotated.pdf")
+        reference, rotations = build_rotated_pdf(args.pdf, bench_pdf, args.pages)
+        print(f"{len(reference)} pages, rotations {rotations}")
+        print(f"{'Mode':<24} {'s/page':>10} {'wall s':>9} {'upright':>9} {'rotated':>9}")
+
+        combined = PDFOCREnhancer(tesseract_path=args.tesseract_path, language=args.combined,
+                                  dpi=args.dpi, preprocessing_level='light')
+        combined.verify_tesseract()
+        run(args.combined, combined, bench_pdf, reference, rotations, args.workers)
+
+        auto = PDFOCREnhancer(tesseract_path=args.tesseract_path, language=args.language,
+                              dpi=args.dpi, preprocessing_level='light', auto_detect=True,
+                              candidate_languages=default_candidate_languages(args.language, LANGUAGES))
+        run(f"auto-detect ({args.language})", auto, bench_pdf, reference, rotations, args.workers)
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
+
+if __name__ == "__main__":
+    main()
@@ -10,19 +10,63 @@ import gc
 import tempfile
 import traceback
 import logging
-from functools import partial
+import time
+from functools import partial, lru_cache
 
 # Configure logging
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Resolution of the thumbnail used for orientation/script detection (OSD)
+OSD_DPI = 150
+
+# Minimum OSD confidences before we trust the detected rotation / script.
+# Orientation confidence is noisy on sparse or low-resolution pages, and rotating an
+# upright page by mistake ruins it, so use the same conservative cut-off as ocrmypdf (14).
+MIN_ORIENTATION_CONF = 14.0
+MIN_SCRIPT_CONF = 1.0
+
+# Upper bound on thumbnail OCR passes used to choose between models of the same script
+MAX_SCORING_PASSES = 2
+
+# Tesseract OSD script names mapped to the language models that can read them
+SCRIPT_LANGUAGES = {
+    'Latin': ['eng', 'fra', 'deu', 'tur'],
+    'Cyrillic': ['rus'],
+}
+
+@lru_cache(maxsize=None)
+def _installed_languages(tesseract_cmd):
+    """Return the traineddata models available to a tesseract binary.
+    
+    Cached per process, so it is shared by all worker threads. Errors are raised
+    rather than cached, so a transient failure is retried on the next page.
+    """
+    return frozenset(pytesseract.get_languages(config=''))
+
+def default_candidate_languages(language, available_languages):
+    """Candidate models for auto-detect: the chosen language(s) plus models of other scripts"""
+    chosen = [lang for lang in language.lower().split('+') if lang in available_languages]
+    chosen_scripts = {script for script, langs in SCRIPT_LANGUAGES.items()
+                      if any(lang in langs for lang in chosen)}
+    others = [lang for script, langs in SCRIPT_LANGUAGES.items() if script not in chosen_scripts
+              for lang in langs if lang in available_languages and lang not in chosen]
+    return chosen + others
+
 class PDFOCREnhancer:
-    def __init__(self, tesseract_path=None, language='eng', dpi=300, preprocessing_level='medium'):
+    def __init__(self, tesseract_path=None, language='eng', dpi=300, preprocessing_level='medium',
+                 auto_detect=False, candidate_languages=None, score_languages=False):
         if tesseract_path:
             pytesseract.pytesseract.tesseract_cmd = tesseract_path
         self.language = language.lower()  # Ensure language is lowercase for tesseract
         self.dpi = dpi
         self.preprocessing_level = preprocessing_level
+        # Per-page orientation fix and language routing via Tesseract OSD
+        self.auto_detect = auto_detect
+        self.candidate_languages = [lang.lower() for lang in (candidate_languages or [self.language])]
+        self.score_languages = score_languages
+        # Per-page detection results and worker timings of the last process_pdf run
+        self.page_detections = []
     
     def verify_tesseract(self):
         """Verify that tesseract is installed and working"""
@@ -70,7 +114,78 @@ class PDFOCREnhancer:
             return dilated
     
     @staticmethod
-    def _process_single_page_static(image_path, page_num, temp_dir, language, preprocessing_level, tesseract_cmd=None):
+    def _score_language(image, language):
+        """Mean word confidence of a quick OCR pass with a single language model"""
+        data = pytesseract.image_to_data(image, lang=language, output_type=pytesseract.Output.DICT)
+        confidences = [float(c) for c, word in zip(data['conf'], data['text'])
+                       if word.strip() and float(c) >= 0]
+        return sum(confidences) / len(confidences) if confidences else 0.0
+    
+    @staticmethod
+    def detect_page_layout(image, dpi, fallback_language, candidate_languages, tesseract_cmd=None,
+                           score_languages=False):
+        """Detect rotation and the best single language model for a page using OSD on a thumbnail.
+        
+        Returns a dict with the clockwise rotation (degrees) needed to upright the page,
+        the detected script and the chosen language. Detection is best-effort: it falls
+        back to no rotation and ``fallback_language`` when OSD is unavailable, not
+        confident, or fails.
+        """
+        detection = {'rotate': 0, 'script': None, 'language': fallback_language}
+        
+        try:
+            installed = _installed_languages(tesseract_cmd or pytesseract.pytesseract.tesseract_cmd)
+            if 'osd' not in installed:
+                logger.warning("osd.traineddata not installed, skipping orientation/script detection")
+                return detection
+            
+            # OSD only needs a low-resolution grayscale thumbnail; shrink before converting
+            factor = int(dpi // OSD_DPI)
+            thumbnail = image.reduce(factor) if factor > 1 else image
+            thumbnail = thumbnail.convert('L')
+            
+            try:
+                osd = pytesseract.image_to_osd(thumbnail, output_type=pytesseract.Output.DICT)
+            except pytesseract.TesseractError as e:
+                # Typically raised for pages with too little text to detect anything
+                logger.info(f"OSD failed, using defaults: {str(e).strip()}")
+                return detection
+            
+            rotate = 0
+            if osd.get('orientation_conf', 0) >= MIN_ORIENTATION_CONF:
+                rotate = int(osd.get('rotate', 0)) % 360
+            if osd.get('script_conf', 0) < MIN_SCRIPT_CONF:
+                detection['rotate'] = rotate
+                return detection
+            
+            script = osd.get('script')
+            candidates = [lang for lang in candidate_languages
+                          if lang in SCRIPT_LANGUAGES.get(script, []) and lang in installed]
+            # The user's own choice wins whenever it can read the detected script
+            preferred = [lang for lang in fallback_language.split('+') if lang in candidates]
+            language = fallback_language
+            if len(preferred) == 1:
+                language = preferred[0]
+            elif len(candidates) == 1 or (candidates and not score_languages):
+                language = candidates[0]
+            elif candidates:
+                # Several models share the script: keep the one that reads the thumbnail best
+                if rotate:
+                    thumbnail = thumbnail.rotate(-rotate, expand=True)
+                scores = {lang: PDFOCREnhancer._score_language(thumbnail, lang)
+                          for lang in candidates[:MAX_SCORING_PASSES]}
+                language = max(scores, key=scores.get)
+            
+            detection.update(rotate=rotate, script=script, language=language)
+        except Exception as e:
+            logger.warning(f"Orientation/script detection failed, using defaults: {str(e)}")
+            detection = {'rotate': 0, 'script': None, 'language': fallback_language}
+        
+        return detection
+    
+    @staticmethod
+    def _process_single_page_static(image_path, page_num, temp_dir, language, preprocessing_level, tesseract_cmd=None,
+                                    auto_detect=False, candidate_languages=None, dpi=300, score_languages=False):
         """Static method for multiprocessing compatibility"""
         try:
             # Set tesseract command if provided
@@ -80,8 +195,26 @@ class PDFOCREnhancer:
             # Load image
             image = Image.open(image_path)
             
+            # Fix rotation and pick the language model before preprocessing
+            detect_start = time.perf_counter()
+            detection = {'rotate': 0, 'script': None, 'language': language}
+            ocr_image = image
+            if auto_detect:
+                detection = PDFOCREnhancer.detect_page_layout(
+                    image, dpi, language, candidate_languages or [language], tesseract_cmd,
+                    score_languages=score_languages
+                )
+                language = detection['language']
+                if detection['rotate']:
+                    # PIL rotates counter-clockwise, OSD reports the clockwise correction
+                    ocr_image = image.rotate(-detection['rotate'], expand=True)
+                logger.info(f"Page {page_num}: script={detection['script']}, "
+                            f"rotate={detection['rotate']}, language={language}")
+            
+            ocr_start = time.perf_counter()
+            
             # Convert PIL image to OpenCV format
-            cv_image = np.array(image)
+            cv_image = np.array(ocr_image)
             
             # Create enhancer instance for preprocessing
             enhancer = PDFOCREnhancer(language=language, preprocessing_level=preprocessing_level)
@@ -102,6 +235,11 @@ class PDFOCREnhancer:
                 lang=language
             )
             
+            # Time spent in this worker only, excluding PDF conversion/merge and queueing
+            ocr_end = time.perf_counter()
+            detection = dict(detection, detect_seconds=ocr_start - detect_start,
+                             ocr_seconds=ocr_end - ocr_start)
+            
             # Save OCR'd page as PDF
             page_pdf_path = os.path.join(temp_dir, f"page_{page_num}.pdf")
             with open(page_pdf_path, "wb") as f:
@@ -117,12 +255,12 @@ class PDFOCREnhancer:
             # Force garbage collection to free memory
             gc.collect()
             
-            return page_num, text, page_pdf_path, original_img_path, processed_img_path
+            return page_num, text, page_pdf_path, original_img_path, processed_img_path, detection
         except Exception as e:
             # Log the error and return it
             error_msg = f"Error processing page {page_num}: {str(e)}\n{traceback.format_exc()}"
             logger.error(error_msg)
-            return page_num, f"ERROR: {str(e)}", None, None, None
+            return page_num, f"ERROR: {str(e)}", None, None, None, None
     
     def process_pdf(self, input_pdf, temp_dir, start_page=1, end_page=None, progress_callback=None, max_workers=None):
         """Process a PDF file with parallel processing"""
@@ -160,6 +298,7 @@ class PDFOCREnhancer:
         searchable_pages = []
         original_pages = []
         processed_pages = []
+        page_detections = []
         
         # Get tesseract path for the worker processes
         tesseract_cmd = pytesseract.pytesseract.tesseract_cmd
@@ -170,7 +309,11 @@ class PDFOCREnhancer:
             temp_dir=page_images_dir,
             language=self.language,
             preprocessing_level=self.preprocessing_level,
-            tesseract_cmd=tesseract_cmd
+            tesseract_cmd=tesseract_cmd,
+            auto_detect=self.auto_detect,
+            candidate_languages=self.candidate_languages,
+            dpi=self.dpi,
+            score_languages=self.score_languages
         )
         
         # Prepare arguments for parallel processing
@@ -204,9 +347,10 @@ class PDFOCREnhancer:
             raise RuntimeError(f"Failed to process pages: {error_pages}")
         
         # Extract results
-        for page_num, text, page_pdf_path, original_img_path, processed_img_path in results:
+        for page_num, text, page_pdf_path, original_img_path, processed_img_path, detection in results:
             all_text.append(f"--- Page {page_num} ---\n{text}\n\n")
             searchable_pages.append(page_pdf_path)
+            page_detections.append(dict(detection, page=page_num))
             
             # Load images for display
             original_pages.append(Image.open(original_img_path))
@@ -226,6 +370,9 @@ class PDFOCREnhancer:
         if progress_callback:
             progress_callback(1.0, "Processing complete!")
         
+        # Keep per-page detection results (rotation, script, language, timings) for the UI
+        self.page_detections = page_detections
+        
         return output_pdf, text_output, all_text, original_pages, processed_pages
     
     def merge_pdfs(self, pdf_files, output_file):